@@ -2,15 +2,41 @@
 Fitness Evaluator - Analyzes products for fitness and workout alignment.
 """
 
+import logging
 import os
+import re
 from typing import Dict
 from google import genai
-from dotenv import load_dotenv
 
 from agent.models import Product, UserProfile
+from agent.utils.response_cache import response_cache
 from agent.utils.data_parser import calculate_macros, extract_nutrition_value
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# The structured response is four short lines; capping output bounds decode time
+MAX_OUTPUT_TOKENS = 512
+
+# "FIELD: value" lines in the model's structured response
+RESPONSE_FIELD_PATTERN = re.compile(
+    r'^[ \t]*(SCORE|SUMMARY|BEST_FOR|RECOMMENDATION):(.*)$', re.MULTILINE
+)
+
+# Values used when the model leaves a field out
+RESPONSE_DEFAULTS = {
+    "score": 50,
+    "summary": "Unable to generate detailed analysis.",
+    "best_for": "General consumption",
+    "recommendation": "Consume in moderation"
+}
+
+# Returned when the response cannot be parsed at all
+PARSE_ERROR_RESPONSE = {
+    "score": 50,
+    "summary": "Error parsing fitness analysis.",
+    "best_for": "Unable to determine",
+    "recommendation": "Consult with a nutritionist"
+}
 
 
 class FitnessEvaluator:
@@ -49,13 +75,18 @@ class FitnessEvaluator:
         fat = extract_nutrition_value(product.nutrition, 'fat')
         macros = calculate_macros(protein, carbs, fat)
 
+        # Partial barcode data often arrives as all zeros; the model adds nothing there
+        calories = extract_nutrition_value(product.nutrition, 'calories')
+        if protein + carbs + fat + calories < 1:
+            return self._generate_fallback_analysis(product, user_profile, macros)
+
         prompt = f"""You are a fitness nutrition expert and AI companion. Analyze this product for someone with these fitness goals: {user_profile.fitness_goals}
 
 Product: {product.name}
 Category: {product.category}
 
 Nutritional Profile:
-- Calories: {extract_nutrition_value(product.nutrition, 'calories')}
+- Calories: {calories}
 - Protein: {protein}g ({macros['protein_percent']:.1f}%)
 - Carbohydrates: {carbs}g ({macros['carb_percent']:.1f}%)
 - Fat: {fat}g ({macros['fat_percent']:.1f}%)
@@ -79,60 +110,49 @@ BEST_FOR: [timing/use case]
 RECOMMENDATION: [your recommendation]
 """
 
+        # Same product and profile produce the same prompt
+        cache_key = response_cache.make_key(self.model_name, prompt)
+
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            response_text = await response_cache.get_or_fetch(
+                cache_key, lambda: self._generate(prompt)
             )
 
-            return self._parse_response(response.text)
+            return self._parse_response(response_text)
 
         except Exception as e:
-            print(f"Fitness evaluation failed: {e}")
+            logger.warning(f"Fitness evaluation failed: {e}")
             return self._generate_fallback_analysis(product, user_profile, macros)
 
+    async def _generate(self, prompt: str) -> str:
+        """Send a prompt to the model and return the response text."""
+        response = await self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config={"max_output_tokens": MAX_OUTPUT_TOKENS}
+        )
+        return response.text
+
     def _parse_response(self, response: str) -> Dict:
         """Parse AI response into structured format."""
         try:
-            lines = [line.strip() for line in response.strip().split("\n") if line.strip()]
-            result = {
-                "score": 50,
-                "summary": "",
-                "best_for": "",
-                "recommendation": ""
-            }
-
-            for line in lines:
-                if line.startswith("SCORE:"):
+            result = RESPONSE_DEFAULTS.copy()
+
+            for match in RESPONSE_FIELD_PATTERN.finditer(response):
+                field, value = match.group(1).lower(), match.group(2).strip()
+                if field == "score":
                     try:
-                        result["score"] = int(line.split(":")[1].strip())
-                    except:
+                        result["score"] = int(value)
+                    except ValueError:
                         pass
-                elif line.startswith("SUMMARY:"):
-                    result["summary"] = line.split(":", 1)[1].strip()
-                elif line.startswith("BEST_FOR:"):
-                    result["best_for"] = line.split(":", 1)[1].strip()
-                elif line.startswith("RECOMMENDATION:"):
-                    result["recommendation"] = line.split(":", 1)[1].strip()
-
-            # Ensure defaults
-            if not result["summary"]:
-                result["summary"] = "Unable to generate detailed analysis."
-            if not result["best_for"]:
-                result["best_for"] = "General consumption"
-            if not result["recommendation"]:
-                result["recommendation"] = "Consume in moderation"
+                elif value:
+                    result[field] = value
 
             return result
 
         except Exception as e:
-            print(f"Error parsing fitness response: {e}")
-            return {
-                "score": 50,
-                "summary": "Error parsing fitness analysis.",
-                "best_for": "Unable to determine",
-                "recommendation": "Consult with a nutritionist"
-            }
+            logger.warning(f"Error parsing fitness response: {e}")
+            return PARSE_ERROR_RESPONSE.copy()
 
     def _generate_fallback_analysis(
         self,
@@ -2,15 +2,62 @@
 Health Evaluator - Analyzes products for health and wellness alignment.
 """
 
+import functools
+import logging
 import os
-from typing import Dict
+import re
+from typing import Dict, Tuple
 from google import genai
-from dotenv import load_dotenv
 
 from agent.models import Product, UserProfile
+from agent.utils.response_cache import response_cache
 from agent.utils.data_parser import extract_nutrition_value
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Enough for the SCORE/SUMMARY/PROS/CONS block without letting replies run long
+MAX_OUTPUT_TOKENS = 512
+
+# "FIELD: value" lines in the model's structured response
+RESPONSE_FIELD_PATTERN = re.compile(
+    r'^[ \t]*(SCORE|SUMMARY|PROS|CONS):(.*)$', re.MULTILINE
+)
+
+# Nutrients listed in the prompt, in display order
+NUTRITION_LABELS = (
+    ("calories", "Calories"),
+    ("protein", "Protein (g)"),
+    ("carbohydrates", "Carbohydrates (g)"),
+    ("sugar", "Sugar (g)"),
+    ("fat", "Total Fat (g)"),
+    ("saturated_fat", "Saturated Fat (g)"),
+    ("sodium", "Sodium (mg)"),
+    ("fiber", "Fiber (g)"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_nutrition_summary(nutrition_items: Tuple) -> str:
+    """
+    Format nutrition facts as prompt lines, skipping zero values.
+
+    Cached because rescans of the same product render identical facts.
+
+    Args:
+        nutrition_items: Nutrition dictionary items as a hashable tuple
+
+    Returns:
+        Newline-separated "- Label: value" lines
+    """
+    nutrition = dict(nutrition_items)
+    lines = []
+
+    for key, label in NUTRITION_LABELS:
+        value = nutrition.get(key, 0)
+        if value > 0:
+            lines.append(f"- {label}: {value}")
+
+    return "\n".join(lines)
 
 
 class HealthEvaluator:
@@ -73,16 +120,18 @@ PROS: [pro1] | [pro2] | [pro3]
 CONS: [con1] | [con2] | [con3]
 """
 
+        # Same product and profile produce the same prompt
+        cache_key = response_cache.make_key(self.model_name, prompt)
+
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            response_text = await response_cache.get_or_fetch(
+                cache_key, lambda: self._generate(prompt)
             )
 
-            return self._parse_response(response.text)
+            return self._parse_response(response_text)
 
         except Exception as e:
-            print(f"Health evaluation failed: {e}")
+            logger.warning(f"Health evaluation failed: {e}")
             return self._generate_fallback_analysis(product, user_profile)
 
     def _build_nutrition_summary(self, product: Product) -> str:
@@ -90,29 +139,20 @@ CONS: [con1] | [con2] | [con3]
         if not product.nutrition:
             return "No nutrition information available"
 
-        lines = []
-        nutrition_labels = {
-            "calories": "Calories",
-            "protein": "Protein (g)",
-            "carbohydrates": "Carbohydrates (g)",
-            "sugar": "Sugar (g)",
-            "fat": "Total Fat (g)",
-            "saturated_fat": "Saturated Fat (g)",
-            "sodium": "Sodium (mg)",
-            "fiber": "Fiber (g)"
-        }
-
-        for key, label in nutrition_labels.items():
-            value = product.nutrition.get(key, 0)
-            if value > 0:
-                lines.append(f"- {label}: {value}")
+        return _format_nutrition_summary(tuple(product.nutrition.items()))
 
-        return "\n".join(lines)
+    async def _generate(self, prompt: str) -> str:
+        """Send a prompt to the model and return the response text."""
+        response = await self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config={"max_output_tokens": MAX_OUTPUT_TOKENS}
+        )
+        return response.text
 
     def _parse_response(self, response: str) -> Dict:
         """Parse AI response into structured format."""
         try:
-            lines = [line.strip() for line in response.strip().split("\n") if line.strip()]
             result = {
                 "score": 50,
                 "summary": "",
@@ -120,20 +160,17 @@ CONS: [con1] | [con2] | [con3]
                 "cons": []
             }
 
-            for line in lines:
-                if line.startswith("SCORE:"):
+            for match in RESPONSE_FIELD_PATTERN.finditer(response):
+                field, value = match.group(1).lower(), match.group(2).strip()
+                if field == "score":
                     try:
-                        result["score"] = int(line.split(":")[1].strip())
-                    except:
+                        result["score"] = int(value)
+                    except ValueError:
                         pass
-                elif line.startswith("SUMMARY:"):
-                    result["summary"] = line.split(":", 1)[1].strip()
-                elif line.startswith("PROS:"):
-                    pros_text = line.split(":", 1)[1].strip()
-                    result["pros"] = [p.strip() for p in pros_text.split("|") if p.strip()]
-                elif line.startswith("CONS:"):
-                    cons_text = line.split(":", 1)[1].strip()
-                    result["cons"] = [c.strip() for c in cons_text.split("|") if c.strip()]
+                elif field == "summary":
+                    result["summary"] = value
+                else:
+                    result[field] = [item.strip() for item in value.split("|") if item.strip()]
 
             # Ensure defaults
             if not result["summary"]:
@@ -146,7 +183,7 @@ CONS: [con1] | [con2] | [con3]
             return result
 
         except Exception as e:
-            print(f"Error parsing health response: {e}")
+            logger.warning(f"Error parsing health response: {e}")
             return {
                 "score": 50,
                 "summary": "Error parsing analysis.",
@@ -5,6 +5,7 @@ A conversational AI companion for personalized nutrition evaluation.
 
 import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 
@@ -20,15 +21,19 @@ from typing import Dict, Optional
 from dotenv import load_dotenv
 from google import genai
 
+# Load .env from project root directory, once for the whole package and before
+# the evaluator modules read cache settings at import time
+_project_root = Path(__file__).parent.parent
+load_dotenv(_project_root / '.env')
+
 from agent.models import Product, UserProfile
 from agent.fitness_evaluator import FitnessEvaluator
 from agent.health_evaluator import HealthEvaluator
 from agent.price_evaluator import PriceEvaluator
 from agent.utils.response_formatter import format_evaluation_response, format_error_response
 
-# Load .env from project root directory
-_project_root = Path(__file__).parent.parent
-load_dotenv(_project_root / '.env')
+# Upper bound on each evaluator so one slow model call can't stall the response
+EVALUATOR_TIMEOUT_SECONDS = 30
 
 
 class NutritionAgent:
@@ -86,11 +91,10 @@ class NutritionAgent:
         """
         try:
             # Run all evaluations in parallel
-            import asyncio
             results = await asyncio.gather(
-                self.health_evaluator.evaluate(product, user_profile),
-                self.fitness_evaluator.evaluate(product, user_profile),
-                self.price_evaluator.evaluate(product),
+                asyncio.wait_for(self.health_evaluator.evaluate(product, user_profile), EVALUATOR_TIMEOUT_SECONDS),
+                asyncio.wait_for(self.fitness_evaluator.evaluate(product, user_profile), EVALUATOR_TIMEOUT_SECONDS),
+                asyncio.wait_for(self.price_evaluator.evaluate(product), EVALUATOR_TIMEOUT_SECONDS),
                 return_exceptions=True
             )
 
@@ -161,7 +165,7 @@ User's message: {message}
 Respond in a warm, conversational, and supportive way. Provide helpful, actionable advice. Keep it friendly and encouraging!"""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=prompt
             )
@@ -229,7 +233,7 @@ Write a friendly, conversational message (3-4 paragraphs) that:
 Be personal and supportive - like a knowledgeable friend, not a clinical report! Vary your opening greeting each time."""
 
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=prompt
             )
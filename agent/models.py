@@ -2,11 +2,15 @@
 Data models for the Nutrition AI Agent system.
 """
 
+from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 from pydantic import BaseModel
 
 
-class Product(BaseModel):
+# Product and UserProfile are plain carriers built from already-cleaned dicts
+# in NutritionAgentService, so they skip pydantic validation and use slots.
+@dataclass(slots=True, kw_only=True)
+class Product:
     """Product data model representing scanned items."""
     name: str
     brand: Optional[str] = None
@@ -17,6 +21,14 @@ class Product(BaseModel):
     nutrition: Optional[Dict[str, float]] = None
     ingredients: Optional[str] = None
 
+    # Stripped, lowercased category for benchmark lookups. Derived once at
+    # construction and not refreshed if category is reassigned afterwards.
+    category_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Derive the category lookup key."""
+        self.category_key = (self.category or "default").strip().lower() or "default"
+
     def get_nutrition_value(self, key: str) -> float:
         """Safely get nutrition value."""
         if not self.nutrition:
@@ -28,7 +40,8 @@ class Product(BaseModel):
         return self.nutrition is not None and len(self.nutrition) > 0
 
 
-class UserProfile(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserProfile:
     """User profile with health and fitness goals."""
     health_goals: str
     fitness_goals: str
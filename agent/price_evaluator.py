@@ -2,14 +2,20 @@
 Price Evaluator - Analyzes product pricing and value for money.
 """
 
+import logging
 import os
-from typing import Dict
+import re
+from bisect import bisect_left
+from typing import Dict, Tuple
 from google import genai
-from dotenv import load_dotenv
 
 from agent.models import Product
+from agent.utils.response_cache import response_cache
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Serving size in grams, e.g. "30g" or "28.5g"
+SERVING_GRAMS_PATTERN = re.compile(r'(\d+\.?\d*)g')
 
 
 class PriceEvaluator:
@@ -32,6 +38,15 @@ class PriceEvaluator:
         "default": {"low": 0.10, "avg": 0.25, "high": 0.45},
     }
 
+    # (low, avg, high) per category, for bisecting a unit price into BASE_RATINGS
+    BENCHMARK_THRESHOLDS = {
+        category: (benchmark["low"], benchmark["avg"], benchmark["high"])
+        for category, benchmark in CATEGORY_BENCHMARKS.items()
+    }
+
+    # A price at or below a threshold gets that threshold's rating
+    BASE_RATINGS = ("Excellent Deal", "Good Price", "Fair Price", "Expensive")
+
     def __init__(self, model_name: str = "gemini-2.0-flash"):
         """Initialize Price Evaluator with AI model."""
         api_key = os.getenv("GOOGLE_API_KEY")
@@ -66,20 +81,22 @@ class PriceEvaluator:
         value_metrics = self._calculate_value_metrics(product)
 
         # Get category benchmark
-        category_key = product.category.lower() if product.category else "default"
+        category_key = product.category_key
         benchmark = self.CATEGORY_BENCHMARKS.get(category_key, self.CATEGORY_BENCHMARKS["default"])
+        thresholds = self.BENCHMARK_THRESHOLDS.get(category_key, self.BENCHMARK_THRESHOLDS["default"])
 
         # Use unit_price (per serving) if available, otherwise use total price
         unit_price = product.unit_price if product.unit_price else product.price
 
         # Determine rating based on multiple factors
         is_good_deal, rating = self._determine_rating_advanced(
-            unit_price, benchmark, value_metrics
+            unit_price, thresholds, value_metrics
         )
+        comparison_percent = ((unit_price - benchmark["avg"]) / benchmark["avg"]) * 100
 
         # Generate AI summary
         summary = await self._generate_summary(
-            product, unit_price, benchmark, rating, value_metrics
+            product, unit_price, benchmark, rating, value_metrics, comparison_percent
         )
 
         return {
@@ -88,7 +105,7 @@ class PriceEvaluator:
             "unit_price": unit_price,
             "category_average": benchmark["avg"],
             "summary": summary,
-            "comparison_percent": ((unit_price - benchmark["avg"]) / benchmark["avg"]) * 100,
+            "comparison_percent": comparison_percent,
             "value_metrics": value_metrics
         }
 
@@ -113,9 +130,8 @@ class PriceEvaluator:
         servings = nutrition.get('servings_per_container', 1) or 1
 
         # Extract serving size in grams
-        import re
         serving_grams = 100  # default
-        match = re.search(r'(\d+\.?\d*)g', str(serving_size_str))
+        match = SERVING_GRAMS_PATTERN.search(str(serving_size_str))
         if match:
             serving_grams = float(match.group(1))
 
@@ -166,7 +182,7 @@ class PriceEvaluator:
         return metrics
 
     def _determine_rating_advanced(
-        self, unit_price: float, benchmark: Dict, value_metrics: Dict
+        self, unit_price: float, thresholds: Tuple[float, float, float], value_metrics: Dict
     ) -> tuple[bool, str]:
         """
         Determine price rating based on multiple value factors.
@@ -174,16 +190,9 @@ class PriceEvaluator:
         Considers not just per-serving price, but also nutritional value.
         """
         # Start with basic per-serving rating
-        is_good_deal = unit_price <= benchmark["avg"]
-
-        if unit_price <= benchmark["low"]:
-            base_rating = "Excellent Deal"
-        elif unit_price <= benchmark["avg"]:
-            base_rating = "Good Price"
-        elif unit_price <= benchmark["high"]:
-            base_rating = "Fair Price"
-        else:
-            base_rating = "Expensive"
+        rating_index = bisect_left(thresholds, unit_price)
+        is_good_deal = rating_index <= 1
+        base_rating = self.BASE_RATINGS[rating_index]
 
         # Adjust rating based on nutritional value
         if value_metrics:
@@ -209,18 +218,10 @@ class PriceEvaluator:
 
     def _determine_rating(self, unit_price: float, benchmark: Dict) -> tuple[bool, str]:
         """Determine price rating based on benchmark (legacy method)."""
-        is_good_deal = unit_price <= benchmark["avg"]
-
-        if unit_price <= benchmark["low"]:
-            rating = "Excellent Deal"
-        elif unit_price <= benchmark["avg"]:
-            rating = "Good Price"
-        elif unit_price <= benchmark["high"]:
-            rating = "Fair Price"
-        else:
-            rating = "Expensive"
+        thresholds = (benchmark["low"], benchmark["avg"], benchmark["high"])
+        rating_index = bisect_left(thresholds, unit_price)
 
-        return is_good_deal, rating
+        return rating_index <= 1, self.BASE_RATINGS[rating_index]
 
     async def _generate_summary(
         self,
@@ -228,7 +229,8 @@ class PriceEvaluator:
         unit_price: float,
         benchmark: Dict,
         rating: str,
-        value_metrics: Dict
+        value_metrics: Dict,
+        comparison_percent: float
     ) -> str:
         """Generate AI-powered price summary."""
         servings = product.nutrition.get('servings_per_container') if product.nutrition else None
@@ -275,27 +277,34 @@ Provide a brief 2-3 sentence friendly summary explaining whether this is a good
 
 Be conversational and helpful! Highlight the BEST value aspect (e.g., "great calorie value" or "excellent protein per dollar")."""
 
+        cache_key = response_cache.make_key(self.model_name, prompt)
+
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            return await response_cache.get_or_fetch(
+                cache_key, lambda: self._generate(prompt)
             )
-            return response.text.strip()
 
         except Exception as e:
-            print(f"Price analysis failed: {e}")
-            return self._generate_fallback_summary(product, unit_price, benchmark, rating, value_metrics)
+            logger.warning(f"Price analysis failed: {e}")
+            return self._generate_fallback_summary(product, unit_price, rating, value_metrics, comparison_percent)
+
+    async def _generate(self, prompt: str) -> str:
+        """Send a prompt to the model and return the stripped response text."""
+        response = await self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=prompt
+        )
+        return response.text.strip()
 
     def _generate_fallback_summary(
         self,
         product: Product,
         unit_price: float,
-        benchmark: Dict,
         rating: str,
-        value_metrics: Dict
+        value_metrics: Dict,
+        comparison_percent: float
     ) -> str:
         """Generate simple summary without AI."""
-        comparison_percent = ((unit_price - benchmark["avg"]) / benchmark["avg"]) * 100
         servings = product.nutrition.get('servings_per_container') if product.nutrition else None
 
         # Find best value aspect to highlight
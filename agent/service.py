@@ -4,10 +4,26 @@ Provides backward compatibility with existing Flask API.
 """
 
 import asyncio
-from typing import Dict, Optional
+import functools
+import logging
+import threading
+from typing import Dict, Optional, Tuple
 from agent.main_agent import get_agent
 from agent.models import Product, UserProfile
 
+logger = logging.getLogger(__name__)
+
+# Profile fields that feed the goal and restriction strings
+_PROFILE_STRING_FIELDS = (
+    "goal_type",
+    "diet_type",
+    "daily_calorie_target",
+    "activity_level",
+    "daily_protein_target_g",
+    "allergies",
+    "dietary_restrictions",
+)
+
 
 class NutritionAgentService:
     """
@@ -43,7 +59,7 @@ class NutritionAgentService:
             return await self.agent.evaluate_product(product, user_profile)
 
         except Exception as e:
-            print(f"Error evaluating product: {e}")
+            logger.error(f"Error evaluating product: {e}")
             return self._error_response()
 
     async def chat(self, message: str, context: Optional[Dict] = None) -> str:
@@ -57,7 +73,11 @@ class NutritionAgentService:
         Returns:
             AI response
         """
-        return await self.agent.chat(message, context)
+        try:
+            return await self.agent.chat(message, context)
+        except Exception as e:
+            logger.error(f"Error in chat: {e}")
+            return "Sorry, I encountered an error. Please try again! ⚠️"
 
     def _dict_to_product(self, data: Dict) -> Product:
         """Convert dictionary to Product model."""
@@ -82,9 +102,9 @@ class NutritionAgentService:
 
     def _dict_to_user_profile(self, data: Dict) -> UserProfile:
         """Convert dictionary to UserProfile model."""
-        health_goals = self._build_health_goals(data)
-        fitness_goals = self._build_fitness_goals(data)
-        restrictions = self._build_restrictions(data)
+        # Profiles rarely change between scans, so the derived strings are cached
+        profile_key = tuple((field, data[field]) for field in _PROFILE_STRING_FIELDS if field in data)
+        health_goals, fitness_goals, restrictions = self._build_profile_strings(profile_key)
 
         return UserProfile(
             health_goals=health_goals,
@@ -101,7 +121,19 @@ class NutritionAgentService:
             daily_fat_target_g=data.get("daily_fat_target_g")
         )
 
-    def _build_health_goals(self, data: Dict) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_profile_strings(profile_key: Tuple) -> Tuple[str, str, str]:
+        """Build health goals, fitness goals and restrictions for a profile key."""
+        data = dict(profile_key)
+        return (
+            NutritionAgentService._build_health_goals(data),
+            NutritionAgentService._build_fitness_goals(data),
+            NutritionAgentService._build_restrictions(data)
+        )
+
+    @staticmethod
+    def _build_health_goals(data: Dict) -> str:
         """Build health goals string from profile data."""
         goals = []
 
@@ -118,7 +150,8 @@ class NutritionAgentService:
 
         return ", ".join(goals) if goals else "general health"
 
-    def _build_fitness_goals(self, data: Dict) -> str:
+    @staticmethod
+    def _build_fitness_goals(data: Dict) -> str:
         """Build fitness goals string from profile data."""
         goals = []
 
@@ -140,7 +173,8 @@ class NutritionAgentService:
 
         return ", ".join(goals) if goals else "general fitness"
 
-    def _build_restrictions(self, data: Dict) -> str:
+    @staticmethod
+    def _build_restrictions(data: Dict) -> str:
         """Build dietary restrictions string."""
         restrictions = []
 
@@ -186,19 +220,39 @@ def get_nutrition_agent_service() -> NutritionAgentService:
     return _service_instance
 
 
+# Background event loop shared by all synchronous callers
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop thread."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="nutrition-agent-loop",
+                daemon=True
+            ).start()
+    return _loop
+
+
 def run_async(coro):
     """
     Run async code from synchronous Flask routes.
 
+    Coroutines are submitted to one long-lived event loop running on a
+    background thread, so async clients keep their connection pools across
+    requests instead of being torn down with a per-call loop. The thread is
+    started on first use so it is created inside each Gunicorn worker rather
+    than in the preloading master.
+
     Args:
         coro: Coroutine to run
 
     Returns:
         Result of the coroutine
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
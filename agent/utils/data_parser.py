@@ -2,8 +2,12 @@
 Data parsing utilities for nutrition information.
 """
 
+import re
 from typing import Dict, Optional
 
+# Everything except digits and the decimal point, e.g. "12.5g" -> "12.5"
+NON_NUMERIC_PATTERN = re.compile(r'[^0-9.]')
+
 
 def parse_nutrition_data(raw_data: Dict) -> Dict[str, float]:
     """
@@ -53,7 +57,10 @@ def calculate_macros(protein: float, carbs: float, fat: float) -> Dict[str, floa
         Dictionary with protein_percent, carb_percent, fat_percent
     """
     # Calculate calories from macros (protein: 4cal/g, carbs: 4cal/g, fat: 9cal/g)
-    total_calories = (protein * 4) + (carbs * 4) + (fat * 9)
+    protein_calories = protein * 4
+    carb_calories = carbs * 4
+    fat_calories = fat * 9
+    total_calories = protein_calories + carb_calories + fat_calories
 
     if total_calories == 0:
         return {
@@ -63,19 +70,22 @@ def calculate_macros(protein: float, carbs: float, fat: float) -> Dict[str, floa
             'total_calories': 0.0
         }
 
+    percent_per_calorie = 100 / total_calories
     return {
-        'protein_percent': (protein * 4 / total_calories) * 100,
-        'carb_percent': (carbs * 4 / total_calories) * 100,
-        'fat_percent': (fat * 9 / total_calories) * 100,
+        'protein_percent': protein_calories * percent_per_calorie,
+        'carb_percent': carb_calories * percent_per_calorie,
+        'fat_percent': fat_calories * percent_per_calorie,
         'total_calories': total_calories
     }
 
 
 def _parse_float(value) -> float:
     """Safely parse a value to float."""
+    if isinstance(value, (int, float)):
+        return float(value)
     try:
         if isinstance(value, str):
-            value = ''.join(c for c in value if c.isdigit() or c == '.')
+            value = NON_NUMERIC_PATTERN.sub('', value)
         return float(value) if value else 0.0
     except (ValueError, TypeError):
         return 0.0
@@ -0,0 +1,117 @@
+"""
+In-memory cache for AI model responses.
+"""
+
+import asyncio
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache with a time-to-live for model response text.
+
+    Evaluator prompts are built only from product and profile data, so an
+    identical prompt can reuse the earlier response instead of making
+    another round-trip to the model.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (0 disables caching)
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a compact cache key from the model name and prompt."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[str]]) -> str:
+        """
+        Return the cached response for a key, fetching it on a miss.
+
+        Concurrent misses for the same key share one in-flight fetch, so a
+        burst of identical scans makes a single model call.
+
+        Args:
+            key: Cache key from make_key
+            fetch: Coroutine function that produces the response
+
+        Returns:
+            Cached or freshly fetched response
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_fetch, key))
+
+        # A caller timing out must not cancel the fetch other callers share
+        return await asyncio.shield(task)
+
+    def _finish_fetch(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished fetch from the in-flight map and cache its result."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache for evaluator responses
+response_cache = ResponseCache(
+    maxsize=int(os.getenv('LLM_CACHE_SIZE', 1024)),
+    ttl_seconds=float(os.getenv('LLM_CACHE_TTL_SECONDS', 3600))
+)
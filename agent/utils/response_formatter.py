@@ -2,8 +2,17 @@
 Response formatting utilities for consistent API responses.
 """
 
+from bisect import bisect_right
 from typing import Dict, List, Optional
 
+# Overall score cut-offs and the (recommendation, emoji) for each band
+RECOMMENDATION_THRESHOLDS = (50, 70)
+RECOMMENDATIONS = (
+    ("Not Recommended", "❌"),
+    ("Acceptable with Caution", "⚠️"),
+    ("Highly Recommended", "✅"),
+)
+
 
 def format_evaluation_response(
     product: Dict,
@@ -72,12 +81,7 @@ def format_error_response(error_message: str) -> Dict:
 
 def _get_recommendation(score: float) -> tuple[str, str]:
     """Determine recommendation and emoji based on score."""
-    if score >= 70:
-        return "Highly Recommended", "✅"
-    elif score >= 50:
-        return "Acceptable with Caution", "⚠️"
-    else:
-        return "Not Recommended", "❌"
+    return RECOMMENDATIONS[bisect_right(RECOMMENDATION_THRESHOLDS, score)]
 
 
 def _error_analysis(analysis_type: str) -> Dict:
@@ -5,6 +5,7 @@ With proper authentication, security, and error handling
 """
 
 import logging
+import re
 import sys
 from flask import Flask, request, jsonify, g
 from flask_cors import CORS
@@ -68,6 +69,12 @@ except ImportError as e:
     logger.warning(f"Nutrition Agent not available: {e}")
     USE_NUTRITION_AGENT = False
 
+# Height in feet'inches format, e.g. 5'8 or 5'8"
+HEIGHT_PATTERN = re.compile(r"^\d+'\d+\"?$")
+
+# First number in a free-form string, e.g. "30g" -> 30
+NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+
 # Simple nutrition data validation
 def validate_nutrition_data(data):
     """Validate nutrition data structure and required fields"""
@@ -282,13 +289,11 @@ def update_profile():
     data = request.get_json() or {}
     logger.debug(f"Profile update for user {user_id}: {data}")
 
-    import re
-
     # Validate and parse height in feet'inches format
     if 'height' in data:
         height_str = str(data['height']).strip()
 
-        if not re.match(r"^\d+'\d+\"?$", height_str):
+        if not HEIGHT_PATTERN.match(height_str):
             return jsonify({
                 'error': "Height must be in format feet'inches (e.g., 5'8). Use only an apostrophe (')."
             }), 400
@@ -396,14 +401,12 @@ def initial_profile_setup():
     user_id = get_current_user_id()
     data = request.get_json() or {}
 
-    import re
-
     # Validate and parse height
     if 'height' not in data:
         return jsonify({'error': 'Height is required'}), 400
 
     height_str = str(data['height']).strip()
-    if not re.match(r"^\d+'\d+\"?$", height_str):
+    if not HEIGHT_PATTERN.match(height_str):
         return jsonify({'error': "Height must be in format feet'inches (e.g., 5'8)"}), 400
 
     try:
@@ -611,7 +614,6 @@ def clean_nutrition_data(nutrition_dict):
     }
 
     cleaned = {}
-    import re
 
     for key, value in nutrition_dict.items():
         # Map key to AI-expected name
@@ -621,7 +623,7 @@ def clean_nutrition_data(nutrition_dict):
             if value is None:
                 cleaned[normalized_key] = 100.0
             elif isinstance(value, str):
-                match = re.search(r'(\d+(?:\.\d+)?)', str(value))
+                match = NUMBER_PATTERN.search(str(value))
                 if match:
                     cleaned[normalized_key] = float(match.group(1))
                 else:
@@ -688,8 +690,9 @@ def evaluate_with_agent():
     # Clean nutrition data
     if 'nutrition' in product_data and product_data['nutrition']:
         product_data['nutrition'] = clean_nutrition_data(product_data['nutrition'])
-        logger.info(f"Cleaned nutrition data keys: {list(product_data['nutrition'].keys())}")
-        logger.info(f"Nutrition values: {product_data['nutrition']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cleaned nutrition data keys: {list(product_data['nutrition'].keys())}")
+            logger.debug(f"Nutrition values: {product_data['nutrition']}")
 
     # Calculate unit price
     product_data = calculate_unit_price(product_data)
@@ -4,7 +4,12 @@ Free, crowdsourced nutrition database with 2.5M+ products
 """
 
 import logging
+import os
+import re
+import threading
+import time
 import requests
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -12,6 +17,27 @@ logger = logging.getLogger(__name__)
 # Open Food Facts API endpoint
 OPENFOODFACTS_API = "https://world.openfoodfacts.org/api/v0/product"
 
+# Shared session so lookups reuse pooled keep-alive connections to Open Food Facts
+http_session = requests.Session()
+
+# Recently found products, keyed by cleaned barcode; staples get rescanned often
+BARCODE_CACHE_SIZE = int(os.getenv('BARCODE_CACHE_SIZE', 512))
+BARCODE_CACHE_TTL_SECONDS = float(os.getenv('BARCODE_CACHE_TTL_SECONDS', 86400))
+_barcode_cache: OrderedDict = OrderedDict()
+_barcode_cache_lock = threading.Lock()
+
+# First number in a quantity string, e.g. "500g" -> 500
+NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Simplified category names, checked in priority order against the cleaned tag
+CATEGORY_PATTERNS = (
+    (re.compile(r'plant based|beverages'), "Food & Beverages"),
+    (re.compile(r'snack'), "Snacks"),
+    (re.compile(r'dairy|milk'), "Dairy"),
+    (re.compile(r'meat'), "Meat & Protein"),
+    (re.compile(r'fruit|vegetable'), "Produce"),
+)
+
 
 def lookup_barcode(barcode: str) -> Optional[Dict[str, Any]]:
     """
@@ -31,11 +57,16 @@ def lookup_barcode(barcode: str) -> Optional[Dict[str, Any]]:
             logger.warning(f"Invalid barcode format: {barcode}")
             return None
 
+        cached_product = _get_cached_product(barcode_clean)
+        if cached_product is not None:
+            logger.info(f"Barcode {barcode_clean} served from cache")
+            return cached_product
+
         # Query Open Food Facts API
         url = f"{OPENFOODFACTS_API}/{barcode_clean}.json"
         logger.info(f"Looking up barcode: {barcode_clean}")
 
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
 
         if response.status_code != 200:
             logger.warning(f"Barcode lookup failed with status {response.status_code}")
@@ -58,6 +89,7 @@ def lookup_barcode(barcode: str) -> Optional[Dict[str, Any]]:
             return None
 
         logger.info(f"Successfully found product: {nutrition_data.get('name', 'Unknown')}")
+        _cache_product(barcode_clean, nutrition_data)
         return nutrition_data
 
     except requests.Timeout:
@@ -71,6 +103,34 @@ def lookup_barcode(barcode: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _get_cached_product(barcode: str) -> Optional[Dict[str, Any]]:
+    """Return a cached lookup result, or None if missing or expired."""
+    with _barcode_cache_lock:
+        entry = _barcode_cache.get(barcode)
+        if entry is None:
+            return None
+
+        expires_at, product = entry
+        if expires_at < time.monotonic():
+            del _barcode_cache[barcode]
+            return None
+
+        _barcode_cache.move_to_end(barcode)
+        return product
+
+
+def _cache_product(barcode: str, product: Dict[str, Any]) -> None:
+    """Cache a found product, evicting the least recently used if full."""
+    if BARCODE_CACHE_SIZE <= 0:
+        return
+
+    with _barcode_cache_lock:
+        _barcode_cache[barcode] = (time.monotonic() + BARCODE_CACHE_TTL_SECONDS, product)
+        _barcode_cache.move_to_end(barcode)
+        while len(_barcode_cache) > BARCODE_CACHE_SIZE:
+            _barcode_cache.popitem(last=False)
+
+
 def clean_category(category_tag: str) -> str:
     """
     Clean Open Food Facts category tags to user-friendly names.
@@ -94,16 +154,10 @@ def clean_category(category_tag: str) -> str:
     cleaned = ' '.join(word.capitalize() for word in cleaned.split())
 
     # Simplify common categories
-    if 'plant based' in cleaned.lower() or 'beverages' in cleaned.lower():
-        return "Food & Beverages"
-    elif 'snack' in cleaned.lower():
-        return "Snacks"
-    elif 'dairy' in cleaned.lower() or 'milk' in cleaned.lower():
-        return "Dairy"
-    elif 'meat' in cleaned.lower():
-        return "Meat & Protein"
-    elif 'fruit' in cleaned.lower() or 'vegetable' in cleaned.lower():
-        return "Produce"
+    cleaned_lower = cleaned.lower()
+    for pattern, simplified in CATEGORY_PATTERNS:
+        if pattern.search(cleaned_lower):
+            return simplified
 
     # Return simplified version or just "Food" if too technical
     if len(cleaned) > 25:
@@ -147,9 +201,8 @@ def extract_nutrition_from_product(product: Dict) -> Optional[Dict[str, Any]]:
         if serving_size and product.get('quantity'):
             try:
                 # Parse quantity (e.g., "500g" -> 500)
-                import re
-                quantity_match = re.search(r'(\d+(?:\.\d+)?)', product.get('quantity', ''))
-                serving_match = re.search(r'(\d+(?:\.\d+)?)', serving_size)
+                quantity_match = NUMBER_PATTERN.search(product.get('quantity', ''))
+                serving_match = NUMBER_PATTERN.search(serving_size)
 
                 if quantity_match and serving_match:
                     total_grams = float(quantity_match.group(1))
@@ -246,7 +299,7 @@ def search_products(query: str, limit: int = 10) -> list[Dict[str, Any]]:
         }
 
         logger.info(f"Searching US products for: {query}")
-        response = requests.get(url, params=params, timeout=10)
+        response = http_session.get(url, params=params, timeout=10)
 
         if response.status_code != 200:
             logger.warning(f"Product search failed with status {response.status_code}")
@@ -266,7 +319,7 @@ def search_products(query: str, limit: int = 10) -> list[Dict[str, Any]]:
                 'page_size': limit * 3,
                 'sort_by': 'unique_scans_n',
             }
-            response = requests.get(url, params=params_global, timeout=10)
+            response = http_session.get(url, params=params_global, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 products = data.get('products', [])
@@ -2,145 +2,42 @@
 """
 Nutrition Agent Service - Integration Layer
 Connects the agent system with the backend API.
+
+The service itself lives in agent.service; this module keeps the backend
+import path stable and warms the singleton at startup.
 """
 
-import sys
 import os
 import logging
-from pathlib import Path
-from typing import Dict, Optional
-import asyncio
+import importlib.util
 
 logger = logging.getLogger(__name__)
 
-# Add the new agent directory to path
-agent_path = Path(__file__).parent.parent / "agent"
-sys.path.insert(0, str(agent_path))
-
-# Import from the NEW agent system
-from agent.service import get_nutrition_agent_service as get_new_service, run_async
+# The agent is imported lazily, so check for the Gemini SDK up front without
+# loading it; api.py treats ImportError here as "agent not available"
+if importlib.util.find_spec("google.genai") is None:
+    raise ImportError("google-genai is not installed")
 
 
-class NutritionAgentService:
-    """
-    Service class to integrate the NEW nutrition agent with the Flask backend.
-    Provides a clean interface for AI-powered evaluation.
-
-    This is a wrapper around the new agent system for backward compatibility.
-    """
-
-    def __init__(self):
-        """
-        Initialize the nutrition agent service.
-
-        Uses Google Gemini API (configured via root .env file).
-        """
-        try:
-            # Initialize the new agent service
-            self._new_service = get_new_service()
-            logger.info("Nutrition agent service initialized successfully")
-        except ValueError as e:
-            logger.error(f"Failed to initialize nutrition agent: {e}")
-            logger.error("Please ensure GOOGLE_API_KEY is set in environment variables")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error initializing nutrition agent: {e}", exc_info=True)
-            raise
-
-
-    async def evaluate_product(
-        self,
-        product_data: Dict,
-        user_profile_data: Dict
-    ) -> Dict:
-        """
-        Evaluate a product using health, price, and fitness agents.
-
-        Args:
-            product_data: Product information (from nutrition facts input)
-            user_profile_data: User's goals and preferences from database
-
-        Returns:
-            Dictionary with comprehensive evaluation from all agents
-        """
-        try:
-            logger.info(f"Evaluating product: {product_data.get('name', 'Unknown')}")
-            return await self._new_service.evaluate_product(product_data, user_profile_data)
-        except Exception as e:
-            logger.error(f"Error evaluating product: {e}", exc_info=True)
-            return self._error_evaluation_response()
-
-    async def chat(self, message: str, context: Optional[Dict] = None) -> str:
-        """
-        Chat with the AI nutrition companion.
-
-        Args:
-            message: User's message
-            context: Optional context (user profile, recent product)
-
-        Returns:
-            AI response string
-        """
-        try:
-            logger.info(f"Chat request: {message[:50]}...")
-            response = await self._new_service.chat(message, context)
-            return response
-        except Exception as e:
-            error_str = str(e)
-            logger.error(f"Error in chat: {e}", exc_info=True)
-
-            # Return user-friendly error messages
-            if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str or "quota" in error_str.lower():
-                return "I've reached my daily API usage limit. Please try again later - the quota resets every 24 hours. 🔄"
-            elif "401" in error_str or "403" in error_str:
-                return "I'm having authentication issues. Please contact support. 🔐"
-            else:
-                return "Sorry, I encountered an error. Please try again! ⚠️"
-
-    def _error_evaluation_response(self) -> Dict:
-        """Return error response for full evaluation"""
-        return {
-            "product": {},
-            "health_analysis": {"score": 0, "summary": "Error", "error": True},
-            "price_analysis": {"score": 0, "summary": "Error", "error": True},
-            "fitness_analysis": {"score": 0, "summary": "Error", "error": True},
-            "overall": {
-                "score": 0,
-                "recommendation": "Error",
-                "recommendation_emoji": "❌"
-            },
-            "companion_message": "Sorry, I encountered an error. Please try again!",
-            "error": "Failed to evaluate product"
-        }
-
-    def is_available(self) -> bool:
-        """Check if the service is properly initialized and available"""
-        return self._new_service is not None and self._new_service.is_available()
-
-
-# Singleton instance for the Flask app
-_nutrition_agent_service = None
-
-
-def get_nutrition_agent_service() -> NutritionAgentService:
+def get_nutrition_agent_service():
     """
     Get or create the nutrition agent service singleton.
 
+    Uses Google Gemini API (configured via root .env file). The agent is
+    imported here so the Gemini SDK only loads once the agent is needed.
+
     Returns:
-        NutritionAgentService instance
+        agent.service.NutritionAgentService instance
     """
-    global _nutrition_agent_service
-
-    if _nutrition_agent_service is None:
-        _nutrition_agent_service = NutritionAgentService()
-
-    return _nutrition_agent_service
+    from agent.service import get_nutrition_agent_service as get_agent_service
+    return get_agent_service()
 
 
-# Async helper for Flask synchronous routes
 def run_async(coro):
     """
-    Helper function to run async code from synchronous Flask routes.
+    Run async code from synchronous Flask routes.
+
+    Delegates to the agent's shared background event loop.
 
     Args:
         coro: Coroutine to run
@@ -148,9 +45,14 @@ def run_async(coro):
     Returns:
         Result of the coroutine
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    from agent.service import run_async as agent_run_async
+    return agent_run_async(coro)
+
+
+# Warm up the service at import so the first request doesn't pay client setup
+if os.getenv("NUTRITION_AGENT_EAGER", "1") == "1":
     try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+        get_nutrition_agent_service()
+        logger.info("Nutrition agent service initialized successfully")
+    except Exception as e:
+        logger.warning(f"Nutrition agent warm-up skipped, will retry on first request: {e}")
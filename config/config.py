@@ -3,6 +3,7 @@ Production-ready configuration management
 """
 import os
 import secrets
+import functools
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -32,7 +33,7 @@ class Config:
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'https://balancebotai.netlify.app')
 
     # CORS Configuration
-    ALLOWED_ORIGINS = os.getenv('ALLOWED_ORIGINS', 'https://balancebotai.netlify.app').split(',')
+    ALLOWED_ORIGINS = tuple(os.getenv('ALLOWED_ORIGINS', 'https://balancebotai.netlify.app').split(','))
 
     # Database Configuration
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'backend/nutrition_app.db')
@@ -79,7 +80,7 @@ class DevelopmentConfig(Config):
     """Development-specific configuration"""
     FLASK_ENV = 'development'
     FLASK_DEBUG = True
-    ALLOWED_ORIGINS = ['http://localhost:3000', 'http://localhost:5000', 'http://127.0.0.1:3000', 'http://127.0.0.1:5000', 'http://0.0.0.0:3000', 'http://0.0.0.0:5000']
+    ALLOWED_ORIGINS = ('http://localhost:3000', 'http://localhost:5000', 'http://127.0.0.1:3000', 'http://127.0.0.1:5000', 'http://0.0.0.0:3000', 'http://0.0.0.0:5000')
 
 
 class ProductionConfig(Config):
@@ -106,8 +107,9 @@ class ProductionConfig(Config):
         return True
 
 
+@functools.lru_cache(maxsize=1)
 def get_config():
-    """Get configuration based on environment"""
+    """Get configuration based on environment (resolved once per process)"""
     env = os.getenv('FLASK_ENV', 'production')
 
     if env == 'development':
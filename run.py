@@ -12,8 +12,10 @@ import sys
 import os
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add project root to path (already there when run as a script)
+PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 # Import configuration
 from config.config import active_config as Config
@@ -31,6 +33,9 @@ except ValueError as e:
 # Import and run the API
 from backend.api import app
 
+# Horizontal rule for the startup banner
+BANNER_RULE = "=" * 60
+
 if __name__ == '__main__':
     # Only show banner once (not in reloader child process)
     if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
@@ -38,22 +43,29 @@ if __name__ == '__main__':
         status_emoji = "🚀" if Config.FLASK_ENV == 'production' else "🔧"
         status_text = "PRODUCTION" if Config.FLASK_ENV == 'production' else "DEVELOPMENT"
 
-        print("\n" + "="*60)
-        print(f"  {status_emoji} BalanceBot API - {status_text}")
-        print("="*60)
-        print(f"  Environment: {Config.FLASK_ENV}")
-        print(f"  Server: http://{Config.HOST}:{Config.PORT}")
-        print(f"  Debug Mode: {'ON ⚠️' if Config.FLASK_DEBUG else 'OFF ✅'}")
-        print(f"  Rate Limiting: {'ON ✅' if Config.RATE_LIMIT_ENABLED else 'OFF'}")
-        print(f"  CORS Origins: {', '.join(Config.ALLOWED_ORIGINS)}")
-        print("="*60)
+        banner = [
+            "",
+            BANNER_RULE,
+            f"  {status_emoji} BalanceBot API - {status_text}",
+            BANNER_RULE,
+            f"  Environment: {Config.FLASK_ENV}",
+            f"  Server: http://{Config.HOST}:{Config.PORT}",
+            f"  Debug Mode: {'ON ⚠️' if Config.FLASK_DEBUG else 'OFF ✅'}",
+            f"  Rate Limiting: {'ON ✅' if Config.RATE_LIMIT_ENABLED else 'OFF'}",
+            f"  CORS Origins: {', '.join(Config.ALLOWED_ORIGINS)}",
+            BANNER_RULE,
+        ]
 
         # Warning for development mode
         if Config.FLASK_ENV == 'development':
-            print("  ⚠️  WARNING: Running in DEVELOPMENT mode")
-            print("  ⚠️  Set FLASK_ENV=production for production deployment")
-            print("="*60)
-        print()
+            banner += [
+                "  ⚠️  WARNING: Running in DEVELOPMENT mode",
+                "  ⚠️  Set FLASK_ENV=production for production deployment",
+                BANNER_RULE,
+            ]
+
+        # Write the whole banner at once
+        print("\n".join(banner) + "\n")
 
     # Start the Flask application
     app.run(